@@ -13,9 +13,25 @@ The addin is just a "run this code on the main thread" proxy.
 import adsk.core
 import adsk.fusion
 import adsk.cam
+import os
 import traceback
 
 
+# Script errors include the full traceback by default. Set
+# FUSION_CAM_BRIDGE_TRACEBACK=0 to return only "Type: message" and skip
+# formatting the stack.
+_INCLUDE_TRACEBACK = os.environ.get("FUSION_CAM_BRIDGE_TRACEBACK", "1") != "0"
+
+
+def _script_error(exc):
+    """Build the error envelope for an exception raised by a script."""
+    if _INCLUDE_TRACEBACK:
+        detail = traceback.format_exc()
+    else:
+        detail = f"{type(exc).__name__}: {exc}"
+    return {"success": False, "error": f"Script execution error:\n{detail}"}
+
+
 def execute_request(request):
     """
     Execute a request on the Fusion main thread.
@@ -26,6 +42,10 @@ def execute_request(request):
           and a params dict available in the namespace. Scripts may
           either define a ``def run(params)`` function (preferred) or
           set the ``result`` variable directly (legacy).
+        - "execute_many": runs a list of ``{"code", "params"}`` scripts
+          in one main-thread dispatch. Each script gets its own namespace
+          and its own success/error envelope, so one failure does not
+          abort the rest of the batch.
 
     Args:
         request: dict with "action" and optionally "code" / "params".
@@ -34,66 +54,120 @@ def execute_request(request):
         dict with "success" (bool) and "data" or "error".
     """
     action = request.get("action", "")
-
-    if action == "ping":
-        return {"success": True, "data": {"status": "ok"}}
-
-    if action == "execute":
-        # The FusionClient sends {"action": "execute", "params": {"code": ..., "params": ...}}
-        # so the code and script params are nested under request["params"].
-        payload = request.get("params", {})
-        code = payload.get("code", "")
-        params = payload.get("params", {})
-
-        if not code:
-            return {"success": False, "error": "No code provided in 'execute' request"}
-
-        # Build the execution namespace with Fusion SDK modules available
-        namespace = {
-            # Fusion SDK top-level modules
-            "adsk": adsk,
-            # Input parameters from the TCP client
-            "params": params,
-            # The script sets this to its return value
-            "result": None,
+    handler = _ACTIONS.get(action)
+    if handler is None:
+        return {
+            "success": False,
+            "error": f"Unknown action: '{action}'. Supported actions: {_SUPPORTED_ACTIONS}"
         }
+    return handler(request.get("params", {}))
+
+
+def _handle_ping(payload):
+    return {"success": True, "data": {"status": "ok"}}
+
+
+def _handle_execute(payload):
+    # The FusionClient sends {"action": "execute", "params": {"code": ..., "params": ...}}
+    # so the code and script params are nested under request["params"].
+    return _execute_script(payload.get("code", ""), payload.get("params", {}), {})
 
+
+def _handle_execute_many(payload):
+    # {"action": "execute_many", "params": {"requests": [{"code": ..., "params": ...}, ...]}}
+    scripts = payload.get("requests")
+    if not isinstance(scripts, list) or not scripts:
+        return {"success": False, "error": "No requests provided in 'execute_many' request"}
+
+    # Shared by every script in the batch so helpers can reuse CAM
+    # lookups (see _request_cache in the query helpers).
+    request_cache = {}
+    results = {}
+    for i, entry in enumerate(scripts):
+        if not isinstance(entry, dict):
+            results[i] = {"success": False, "error": "Batch entry must be an object"}
+            continue
         try:
-            exec(code, namespace)
-        except Exception:
-            return {
-                "success": False,
-                "error": f"Script execution error:\n{traceback.format_exc()}"
-            }
-
-        # Preferred path: script defines a run(params) function
-        run_fn = namespace.get("run")
-        if callable(run_fn):
-            try:
-                namespace["result"] = run_fn(params)
-            except Exception:
-                return {
-                    "success": False,
-                    "error": f"Script execution error:\n{traceback.format_exc()}"
-                }
-
-        result = namespace.get("result")
-        if result is None:
-            return {
-                "success": False,
-                "error": "Script completed but did not set 'result'. "
-                         "Define a run(params) function or assign to the 'result' variable."
-            }
-
-        # If the script returned an error dict from a helper function
-        # (e.g. _get_cam() returning {"success": False, "error": "..."}),
-        # propagate it directly instead of wrapping in another success envelope.
-        if isinstance(result, dict) and result.get("success") is False:
-            return result
-
-        return {"success": True, "data": result}
-
-    return {
-        "success": False,
-        "error": f"Unknown action: '{action}'. Supported actions: ['ping', 'execute']"
+            results[i] = _execute_script(
+                entry.get("code", ""), entry.get("params", {}), request_cache
+            )
+        except Exception as e:
+            results[i] = _script_error(e)
+    return {"success": True, "data": {"results": results}}
+
+
+# Action name -> handler(payload). Built once at import.
+_ACTIONS = {
+    "ping": _handle_ping,
+    "execute": _handle_execute,
+    "execute_many": _handle_execute_many,
+}
+_SUPPORTED_ACTIONS = str(list(_ACTIONS))
+
+
+# Compiled code objects keyed by script source. Query scripts are the
+# shared helpers plus a small query body, so the same few sources arrive
+# over and over; compiling them once skips re-parsing ~2k lines of
+# helpers on every request. Source (not marshalled bytecode) stays the
+# wire format because the CLI's Python need not match Fusion's.
+_CODE_CACHE_MAX = 64
+_code_cache = {}
+
+
+def _compile_script(code):
+    """Compile *code*, reusing the cached code object for repeated sources."""
+    compiled = _code_cache.get(code)
+    if compiled is None:
+        compiled = compile(code, "<fusion-cam script>", "exec")
+        if len(_code_cache) >= _CODE_CACHE_MAX:
+            # Drop the oldest entry (dicts keep insertion order).
+            del _code_cache[next(iter(_code_cache))]
+        _code_cache[code] = compiled
+    return compiled
+
+
+def _execute_script(code, params, request_cache):
+    """Run one script and wrap its result in a success/error envelope."""
+    if not code:
+        return {"success": False, "error": "No code provided in 'execute' request"}
+
+    # Build the execution namespace with Fusion SDK modules available
+    namespace = {
+        # Fusion SDK top-level modules
+        "adsk": adsk,
+        # Input parameters from the TCP client
+        "params": params,
+        # Scratch dict shared by all scripts in one dispatch
+        "request_cache": request_cache,
+        # The script sets this to its return value
+        "result": None,
     }
+
+    try:
+        exec(_compile_script(code), namespace)
+    except Exception as e:
+        return _script_error(e)
+
+    # Preferred path: script defines a run(params) function
+    run_fn = namespace.get("run")
+    if callable(run_fn):
+        try:
+            namespace["result"] = run_fn(params)
+        except Exception as e:
+            return _script_error(e)
+
+    result = namespace.get("result")
+    if result is None:
+        return {
+            "success": False,
+            "error": "Script completed but did not set 'result'. "
+                     "Define a run(params) function or assign to the 'result' variable."
+        }
+
+    # If the script returned an error dict from a helper function
+    # (e.g. _get_cam() returning {"success": False, "error": "..."}),
+    # propagate it directly instead of wrapping in another success envelope.
+    if isinstance(result, dict) and result.get("success") is False:
+        return result
+
+    return {"success": True, "data": result}
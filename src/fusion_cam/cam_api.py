@@ -19,6 +19,22 @@ READ_ONLY_ERROR = (
     "To enable them, run with --mode full (or set FUSION_CAM_MODE=full)."
 )
 
+# Read-only queries: safe to batch with get-many.
+READ_QUERIES = (
+    "list_documents",
+    "get_document_info",
+    "get_setups",
+    "get_operations",
+    "get_operation_details",
+    "get_tools",
+    "get_library_tools",
+    "get_machining_time",
+    "get_toolpath_status",
+    "get_nc_programs",
+    "list_material_libraries",
+    "get_material_properties",
+)
+
 
 def bridge_ping(client: FusionClient) -> dict[str, Any]:
     try:
@@ -45,6 +61,26 @@ def bridge_execute_query(
         return {"success": False, "error": str(e), "code": "INTERNAL_ERROR"}
 
 
+def bridge_execute_queries(
+    client: FusionClient, queries: list[tuple[str, dict | None]]
+) -> dict[str, Any]:
+    """Run several named queries in one bridge dispatch (``execute_many``).
+
+    The bridge returns ``{"results": {index: envelope}}``; each envelope is
+    the same shape a single ``bridge_execute_query`` call would return.
+    """
+    requests = []
+    for name, params in queries:
+        request = load_query(name, params)
+        requests.append({"code": request["code"], "params": request["params"]})
+    try:
+        return client.send_request("execute_many", {"requests": requests})
+    except ConnectionError as e:
+        return {"success": False, "error": str(e), "code": "CONNECTION_ERROR"}
+    except Exception as e:
+        return {"success": False, "error": str(e), "code": "INTERNAL_ERROR"}
+
+
 def bridge_execute_raw(
     client: FusionClient,
     code: str,
@@ -89,6 +125,10 @@ class CamSession:
                 return blocked
         return bridge_execute_query(self.client, name, params or {})
 
+    def query_many(self, queries: list[tuple[str, dict | None]]) -> dict[str, Any]:
+        """Run read-only queries in one round trip; see bridge_execute_queries."""
+        return bridge_execute_queries(self.client, queries)
+
     def debug(
         self,
         code: str,
@@ -12,7 +12,7 @@ import os
 import sys
 from typing import Any, Callable
 
-from .cam_api import CamSession
+from .cam_api import READ_QUERIES, CamSession
 from .queries import get_helpers_code
 from .version_info import __version__ as _PKG_VER
 
@@ -149,6 +149,47 @@ def _h_get_nc_programs(s: CamSession, a: argparse.Namespace) -> dict[str, Any]:
     return s.query("get_nc_programs", _params(a, ("document_name",)))
 
 
+def _h_get_many(s: CamSession, a: argparse.Namespace) -> dict[str, Any]:
+    queries = []
+    for entry in a.queries_json:
+        if isinstance(entry, str):
+            name, params = entry, {}
+        elif isinstance(entry, dict) and isinstance(entry.get("query"), str):
+            name, params = entry["query"], entry.get("params") or {}
+        else:
+            return {
+                "success": False,
+                "error": 'get-many: each entry must be a query name or {"query": ..., "params": {...}}',
+                "code": "INVALID_ARGS",
+            }
+        name = name.replace("-", "_")
+        if name not in READ_QUERIES:
+            return {
+                "success": False,
+                "error": f"get-many: '{name}' is not a batchable read query. "
+                         f"Valid: {list(READ_QUERIES)}",
+                "code": "INVALID_ARGS",
+            }
+        if not isinstance(params, dict):
+            return {
+                "success": False,
+                "error": f"get-many: params for '{name}' must be a JSON object",
+                "code": "INVALID_ARGS",
+            }
+        if a.document_name is not None:
+            params = {"document_name": a.document_name, **params}
+        queries.append((name, params))
+    if not queries:
+        return {"success": False, "error": "get-many: no queries given", "code": "INVALID_ARGS"}
+    out = s.query_many(queries)
+    # The bridge reports success for the batch itself; fail the command
+    # (and its exit code) when none of the queries succeeded.
+    results = (out.get("data") or {}).get("results") if out.get("success") else None
+    if results is not None and not any(r.get("success") for r in results.values()):
+        out = {**out, "success": False, "error": "get-many: every query failed; see data.results"}
+    return out
+
+
 def _h_generate_toolpaths(s: CamSession, a: argparse.Namespace) -> dict[str, Any]:
     d = _params(a, ("setup_name", "document_name"))
     if a.operation_names_json is not None:
@@ -450,6 +491,34 @@ def build_parser() -> argparse.ArgumentParser:
     )
     _add_common_doc(p)
 
+    p = subcmd(
+        "get-many",
+        help_text="Run several read queries in one bridge round trip",
+        desc=(
+            "Bridge action execute_many. Runs read-only queries back to back in one "
+            "main-thread dispatch and returns {\"results\": {index: envelope}}; one "
+            "failing query does not abort the others. The command fails (exit 1) "
+            "only if every query fails. The whole batch shares the bridge's single "
+            "30 s main-thread wait: if the queries together take longer, the batch "
+            "times out and no results are returned, so split slow queries "
+            "(e.g. get_operation_details, get_library_tools) into separate calls."
+        ),
+        epilog=(
+            "Example:\n"
+            '  fusion-cam get-many --queries-json \'["get_document_info","get_setups","get_operations"]\'\n'
+            "  fusion-cam get-many --queries-json \\\n"
+            '    \'["get_setups",{"query":"get_machining_time","params":{"setup_name":"Setup1"}}]\''
+        ),
+        handler=_h_get_many,
+    )
+    p.add_argument(
+        "--queries-json",
+        type=_json_type_list,
+        required=True,
+        help='JSON array of query names or {"query": name, "params": {...}} objects.',
+    )
+    _add_common_doc(p)
+
     p = subcmd(
         "generate-toolpaths",
         help_text="Regenerate toolpaths (long-running; requires --mode full)",
@@ -12,6 +12,19 @@ DEFAULT_PORT = 9876
 DEFAULT_HOST = "127.0.0.1"
 DEFAULT_TIMEOUT = 30.0
 
+# Receive buffer for the bridge socket; large query results (operation
+# details, tool libraries) arrive in fewer recv() calls.
+_SOCKET_RCVBUF = 1 << 20
+_RECV_CHUNK_SIZE = 65536
+
+# TCP keepalive: probe an idle connection after 5 s, every 2 s, and give
+# up after 3 misses, so a dead bridge is noticed in ~11 s rather than at
+# the request timeout. Also bound unacknowledged sends to 5 s (Linux).
+_KEEPALIVE_IDLE = 5
+_KEEPALIVE_INTERVAL = 2
+_KEEPALIVE_COUNT = 3
+_TCP_USER_TIMEOUT_MS = 5000
+
 
 def get_port():
     """Return the configured TCP port (`FUSION_CAM_BRIDGE_PORT`) or the default."""
@@ -35,6 +48,11 @@ class FusionClient:
         self._port = port or get_port()
         self._timeout = timeout or DEFAULT_TIMEOUT
         self._socket = None
+        # Bytes received past the last newline, kept for the next response.
+        self._recv_buffer = bytearray()
+        # Reused recv_into() target, so reads do not allocate per chunk.
+        self._recv_chunk = bytearray(_RECV_CHUNK_SIZE)
+        self._recv_view = memoryview(self._recv_chunk)
 
     def _ensure_connected(self):
         """Connect to the add-in if not already connected."""
@@ -44,6 +62,7 @@ class FusionClient:
         try:
             self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._socket.settimeout(self._timeout)
+            self._tune_socket(self._socket)
             self._socket.connect((self._host, self._port))
         except (ConnectionRefusedError, socket.timeout, OSError) as e:
             self._socket = None
@@ -54,6 +73,38 @@ class FusionClient:
                 f"Error: {e}"
             )
 
+    @staticmethod
+    def _tune_socket(sock):
+        """Set low-latency and liveness options on the bridge socket.
+
+        TCP_NODELAY disables Nagle so a request is sent immediately;
+        TCP_QUICKACK (Linux only) avoids delayed ACKs. Keepalive detects a
+        half-open connection to a crashed bridge. Platform-specific options
+        are applied only where the socket module has them, and failures are
+        ignored: these are optimizations, not requirements.
+        """
+        options = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, _SOCKET_RCVBUF),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        for name, value in (
+            ("TCP_QUICKACK", 1),
+            ("TCP_KEEPIDLE", _KEEPALIVE_IDLE),        # Linux, Windows 10+
+            ("TCP_KEEPALIVE", _KEEPALIVE_IDLE),       # macOS spelling
+            ("TCP_KEEPINTVL", _KEEPALIVE_INTERVAL),
+            ("TCP_KEEPCNT", _KEEPALIVE_COUNT),
+            ("TCP_USER_TIMEOUT", _TCP_USER_TIMEOUT_MS),
+        ):
+            opt = getattr(socket, name, None)
+            if opt is not None:
+                options.append((socket.IPPROTO_TCP, opt, value))
+        for level, name, value in options:
+            try:
+                sock.setsockopt(level, name, value)
+            except OSError:
+                pass
+
     def _disconnect(self):
         """Close the connection."""
         if self._socket:
@@ -62,6 +113,7 @@ class FusionClient:
             except Exception:
                 pass
             self._socket = None
+        self._recv_buffer.clear()
 
     def send_request(self, action, params=None):
         """
@@ -85,10 +137,11 @@ class FusionClient:
         for attempt in range(2):
             try:
                 self._ensure_connected()
-                request_bytes = (json.dumps(request) + "\n").encode("utf-8")
+                request_bytes = json.dumps(request).encode("utf-8") + b"\n"
                 self._socket.sendall(request_bytes)
 
-                # Read response (newline-delimited)
+                # Read response (newline-delimited); json.loads takes the
+                # UTF-8 bytes directly, so there is no separate decode pass.
                 response_data = self._read_response()
                 return json.loads(response_data)
 
@@ -103,17 +156,28 @@ class FusionClient:
                 raise ValueError(f"Invalid JSON response from add-in: {e}")
 
     def _read_response(self):
-        """Read a newline-delimited JSON response from the socket."""
-        buffer = ""
-        while True:
-            data = self._socket.recv(65536)
-            if not data:
-                raise ConnectionError("Connection closed by bridge")
+        """Read one newline-delimited JSON response from the socket.
 
-            buffer += data.decode("utf-8")
-            if "\n" in buffer:
-                line, _ = buffer.split("\n", 1)
+        Returns the line as bytes (without the newline). Accumulating raw
+        bytes means a multi-byte UTF-8 character split across recv() calls
+        is handled and large responses are not re-concatenated as str.
+        Anything after the newline stays in ``_recv_buffer`` for the next
+        call.
+        """
+        buf = self._recv_buffer
+        scan_from = 0
+        while True:
+            idx = buf.find(b"\n", scan_from)
+            if idx != -1:
+                line = bytes(buf[:idx])
+                del buf[:idx + 1]
                 return line.strip()
+            scan_from = len(buf)
+
+            n = self._socket.recv_into(self._recv_view)
+            if not n:
+                raise ConnectionError("Connection closed by bridge")
+            buf += self._recv_view[:n]
 
     def close(self):
         """Close the connection."""
@@ -7,14 +7,22 @@ a standalone binary.
 
 from __future__ import annotations
 
+import functools
 import json
 import os
-import platform
 import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+# Resolved once; the path helpers below all branch on these. sys.platform
+# avoids importing the platform module just for the OS name.
+_IS_MAC = sys.platform == "darwin"
+_IS_WINDOWS = sys.platform.startswith("win")
+_HOME = os.path.expanduser("~")
 
+
+@functools.cache
 def _get_version() -> str:
     from .version_info import __version__
 
@@ -22,23 +30,22 @@ def _get_version() -> str:
 
 
 def _get_install_dir() -> str:
-    system = platform.system()
-    if system == "Darwin":
+    if _IS_MAC:
         return os.path.join(
-            os.path.expanduser("~"),
+            _HOME,
             "Library",
             "Application Support",
             "fusion-cam-cli",
         )
-    elif system == "Windows":
+    elif _IS_WINDOWS:
         return os.path.join(
             os.environ.get(
-                "LOCALAPPDATA", os.path.join(os.path.expanduser("~"), "AppData", "Local")
+                "LOCALAPPDATA", os.path.join(_HOME, "AppData", "Local")
             ),
             "fusion-cam-cli",
         )
     return os.path.join(
-        os.environ.get("XDG_DATA_HOME", os.path.join(os.path.expanduser("~"), ".local", "share")),
+        os.environ.get("XDG_DATA_HOME", os.path.join(_HOME, ".local", "share")),
         "fusion-cam-cli",
     )
 
@@ -47,10 +54,9 @@ INSTALL_DIR = _get_install_dir()
 
 
 def _get_fusion_addins_dir() -> str:
-    system = platform.system()
-    if system == "Darwin":
+    if _IS_MAC:
         return os.path.join(
-            os.path.expanduser("~"),
+            _HOME,
             "Library",
             "Application Support",
             "Autodesk",
@@ -58,7 +64,7 @@ def _get_fusion_addins_dir() -> str:
             "API",
             "AddIns",
         )
-    elif system == "Windows":
+    elif _IS_WINDOWS:
         return os.path.join(
             os.environ.get("APPDATA", ""),
             "Autodesk",
@@ -66,7 +72,7 @@ def _get_fusion_addins_dir() -> str:
             "API",
             "AddIns",
         )
-    return os.path.join(os.path.expanduser("~"), "fusion-cam-cli", "fusion-bridge")
+    return os.path.join(_HOME, "fusion-cam-cli", "fusion-bridge")
 
 
 ADDIN_DEST = os.path.join(_get_fusion_addins_dir(), "fusion-bridge")
@@ -76,6 +82,7 @@ def _package_dir() -> Path:
     return Path(__file__).resolve().parent
 
 
+@functools.cache
 def _get_bundled_addin_dir() -> str | None:
     """Wheel: bridge_addon next to package. Dev: repo fusion-bridge/."""
     pkg = _package_dir()
@@ -104,16 +111,15 @@ def _prompt(message: str, default: str = "y", valid: set | None = None) -> str:
 
 
 def _get_fusion_base_dir() -> str:
-    system = platform.system()
-    if system == "Darwin":
+    if _IS_MAC:
         return os.path.join(
-            os.path.expanduser("~"),
+            _HOME,
             "Library",
             "Application Support",
             "Autodesk",
             "Autodesk Fusion 360",
         )
-    elif system == "Windows":
+    elif _IS_WINDOWS:
         return os.path.join(
             os.environ.get("APPDATA", ""),
             "Autodesk",
@@ -122,11 +128,29 @@ def _get_fusion_base_dir() -> str:
     return ""
 
 
+FUSION_BASE_DIR = _get_fusion_base_dir()
+
+
 def _check_fusion_installed() -> bool:
-    fusion_dir = _get_fusion_base_dir()
-    if not fusion_dir:
+    if not FUSION_BASE_DIR:
         return True
-    return os.path.isdir(fusion_dir)
+    return os.path.isdir(FUSION_BASE_DIR)
+
+
+def _copy_if_changed(src: str, dst: str) -> str:
+    """copytree copy_function: skip files whose size and mtime already match.
+
+    copy2 preserves mtimes, so a file installed by a previous run matches
+    until its source changes; re-installs then cost one stat per file.
+    """
+    try:
+        s_src = os.stat(src)
+        s_dst = os.stat(dst)
+        if s_src.st_size == s_dst.st_size and s_src.st_mtime_ns == s_dst.st_mtime_ns:
+            return dst
+    except OSError:
+        pass
+    return shutil.copy2(src, dst)
 
 
 def _extract_addin() -> str:
@@ -135,26 +159,55 @@ def _extract_addin() -> str:
         print("  ERROR: Add-in source not found (expected bundled bridge or repo fusion-bridge/).")
         sys.exit(1)
     try:
-        shutil.copytree(source, ADDIN_DEST, dirs_exist_ok=True)
+        shutil.copytree(
+            source, ADDIN_DEST, dirs_exist_ok=True, copy_function=_copy_if_changed
+        )
     except (OSError, PermissionError) as e:
         print(f"  ERROR: Cannot extract add-in to {ADDIN_DEST}: {e}")
         sys.exit(1)
     return ADDIN_DEST
 
 
+VERSION_FILE = os.path.join(INSTALL_DIR, "version.json")
+
+
 def _version_file() -> str:
-    return os.path.join(INSTALL_DIR, "version.json")
+    return VERSION_FILE
 
 
 def _write_installed_version(version: str) -> None:
+    """Write version.json atomically (temp file in the same dir + os.replace).
+
+    The payload is flushed and fsynced before the rename, so a crash leaves
+    either the old file or the complete new one.
+    """
     path = _version_file()
+    tmp_path = None
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({"version": version}, f, indent=2)
-            f.write("\n")
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=".version-", suffix=".json", dir=os.path.dirname(path)
+        )
+        payload = (json.dumps({"version": version}, indent=2) + "\n").encode("utf-8")
+        with os.fdopen(fd, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates the file 0600; keep the usual rw-r--r-- mode.
+        try:
+            os.chmod(tmp_path, 0o644)
+        except OSError:
+            pass
+        os.replace(tmp_path, path)
+        tmp_path = None
     except OSError:
         pass
+    finally:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
 
 
 def run_uninstall() -> None:
@@ -213,7 +266,7 @@ def run_install() -> None:
 
     if not _check_fusion_installed():
         print("  WARNING: Fusion 360 default data folder not found.")
-        print(f"    Expected: {_get_fusion_base_dir()}")
+        print(f"    Expected: {FUSION_BASE_DIR}")
         skip = _prompt("  Install add-in files anyway? (y/n)", "n", {"y", "n"})
         if skip.lower() != "y":
             print("  Cancelled.")
@@ -0,0 +1,266 @@
+# ──────────────────────────────────────────────────────────────────────
+# Constants and parameter category sets for Fusion 360 CAM query scripts.
+#
+# Pure Python (no adsk imports), so it sorts and loads ahead of _1_base.py
+# and can also be imported on its own by tooling outside Fusion.
+# ──────────────────────────────────────────────────────────────────────
+
+import re
+
+# ──────────────────────────────────────────────────────────────────────
+# CAM parameter category sets
+# ──────────────────────────────────────────────────────────────────────
+
+FEED_PARAMS = frozenset({
+    "tool_feedCutting",
+    "tool_feedEntry",
+    "tool_feedExit",
+    "tool_feedPlunge",
+    "tool_feedRamp",
+    "tool_feedRetract",
+    "tool_feedTransition",
+    "tool_feedPerTooth",
+})
+
+SPEED_PARAMS = frozenset({
+    "tool_spindleSpeed",
+    "tool_rampSpindleSpeed",
+    "tool_clockwise",
+})
+
+ENGAGEMENT_PARAMS = frozenset({
+    "stepover",
+    "stepdown",
+    "finishStepover",
+    "finishStepdown",
+    "optimalLoad",
+    "loadDeviation",
+    "maximumStepdown",
+    "fineStepdown",
+})
+
+TOOL_GEOM_PARAMS = frozenset({
+    "tool_diameter",
+    "tool_numberOfFlutes",
+    "tool_fluteLength",
+    "tool_overallLength",
+    "tool_shoulderLength",
+    "tool_shaftDiameter",
+    "tool_type",
+    "tool_number",
+    "tool_comment",
+    "tool_description",
+    "tool_bodyLength",
+    "tool_cornerRadius",
+    "tool_taperAngle",
+    "tool_tipAngle",
+})
+
+STRATEGY_PARAMS = frozenset({
+    "tolerance",
+    "contourTolerance",
+    "smoothingTolerance",
+    "useStockToLeave",
+    "stockToLeave",
+    "axialStockToLeave",
+    "finishStockToLeave",
+    "finishAxialStockToLeave",
+    "bothWays",
+    "machineShallowAreas",
+    "machineSteepAreas",
+    "direction",
+    "compensation",
+    "compensationType",
+})
+
+LINKING_PARAMS = frozenset({
+    "leadInRadius",
+    "leadOutRadius",
+    "leadInSweepAngle",
+    "leadOutSweepAngle",
+    "leadInVerticalRadius",
+    "leadOutVerticalRadius",
+    "rampType",
+    "rampAngle",
+    "rampDiameter",
+    "rampClearanceHeight",
+    "entryPositionType",
+    "exitPositionType",
+    "useRetracts",
+    "keepToolDown",
+    "liftHeight",
+})
+
+DRILLING_PARAMS = frozenset({
+    "cycleType",
+    "dwellTime",
+    "dwellEnabled",
+    "peckingDepth",
+    "accumulatedPeckingDepth",
+    "chipBreakDistance",
+    "breakThroughDistance",
+    "breakThroughFeedrate",
+    "backBoreDistance",
+    "threading",
+    "pitch",
+})
+
+PASS_PARAMS = frozenset({
+    "numberOfStepdowns",
+    "useFinishingPasses",
+    "finishingPasses",
+    "doMultipleDepths",
+    "restMachining",
+    "restMachiningAdjustment",
+    "useTabbing",
+    "tabWidth",
+    "tabHeight",
+    "tabCount",
+    "tabPositioning",
+})
+
+HEIGHT_PARAMS = frozenset({
+    "clearanceHeight_value",
+    "clearanceHeight_offset",
+    "retractHeight_value",
+    "retractHeight_offset",
+    "feedHeight_value",
+    "feedHeight_offset",
+    "topHeight_value",
+    "topHeight_offset",
+    "bottomHeight_value",
+    "bottomHeight_offset",
+})
+
+ALL_PARAM_CATEGORIES = {
+    "feeds":      FEED_PARAMS,
+    "speeds":     SPEED_PARAMS,
+    "engagement": ENGAGEMENT_PARAMS,
+    "tool":       TOOL_GEOM_PARAMS,
+    "strategy":   STRATEGY_PARAMS,
+    "heights":    HEIGHT_PARAMS,
+    "linking":    LINKING_PARAMS,
+    "drilling":   DRILLING_PARAMS,
+    "passes":     PASS_PARAMS,
+}
+
+ALL_KNOWN_PARAMS = set().union(*ALL_PARAM_CATEGORIES.values())
+
+# Frozen views for the per-parameter hot loop in get_operation_details.
+_ALL_KNOWN_PARAM_NAMES = frozenset(ALL_KNOWN_PARAMS)
+_CATEGORY_ITEMS = tuple(ALL_PARAM_CATEGORIES.items())
+
+# name -> category for every explicitly listed parameter; the first
+# category in ALL_PARAM_CATEGORIES order wins if a name is listed twice
+# (built in reverse so earlier categories overwrite later ones).
+_KNOWN_PARAM_CATEGORY = {
+    name: cat
+    for cat, cat_params in reversed(_CATEGORY_ITEMS)
+    for name in cat_params
+}
+
+# Prefix rules for auto-categorizing parameters not in the explicit sets.
+# Order matters: the first matching rule wins (tool_ramp* is "speeds",
+# not "tool").
+_AUTO_CATEGORY_RULES = (
+    ("feeds",    ("tool_feed",)),
+    ("speeds",   ("tool_spindle", "tool_ramp")),
+    ("tool",     ("tool_",)),
+    ("heights",  ("clearanceHeight", "retractHeight", "feedHeight", "topHeight", "bottomHeight")),
+    ("linking",  ("leadIn", "leadOut", "ramp", "entry", "exit")),
+    ("drilling", ("cycle", "dwell", "pecking", "chipBreak",
+                  "breakThrough", "backBore", "threading", "pitch")),
+    ("passes",   ("numberOfStep", "finishing", "doMultiple",
+                  "restMachining", "useTab", "tab")),
+)
+
+# One named group per category, alternated in rule order, so a single
+# match() replaces walking the rules in Python.
+_AUTO_CATEGORY_RE = re.compile("|".join(
+    f"(?P<{category}>{'|'.join(map(re.escape, prefixes))})"
+    for category, prefixes in _AUTO_CATEGORY_RULES
+))
+
+
+# ──────────────────────────────────────────────────────────────────────
+# Other constants
+# ──────────────────────────────────────────────────────────────────────
+
+CAM_PRODUCT_TYPE = "CAMProductType"
+DESIGN_PRODUCT_TYPE = "DesignProductType"
+
+OPERATION_TYPE_MAP = {
+    0: "milling",
+    1: "turning",
+    2: "jet",
+    3: "additive",
+}
+
+DISTANCE_UNIT_MAP = {0: "mm", 1: "cm", 2: "m", 3: "in", 4: "ft"}
+
+DEFAULT_RAPID_FEED = 500.0       # cm/min (~200 ipm)
+DEFAULT_TOOL_CHANGE_TIME = 15.0  # seconds
+
+# Machine-related parameter names to read from setups.
+_MACHINE_PARAM_NAMES = [
+    "job_machine",
+    "job_machine_manufacturer",
+    "job_machine_type",
+    "job_machine_configuration",
+    "job_machine_configuration_id",
+    "job_machine_build_strategy_id",
+    "machine_dimension_x",
+    "machine_dimension_y",
+    "machine_dimension_z",
+    "machineMaxTilt",
+]
+
+# Stock-related parameter names to read from setups.
+_STOCK_PARAM_NAMES = [
+    "job_stockMode",
+    "job_stockFixedX",
+    "job_stockFixedY",
+    "job_stockFixedZ",
+    "job_stockFixed_width",
+    "job_stockFixed_height",
+    "job_stockFixed_depth",
+    "job_stockOffsetSide",
+    "job_stockOffsetTop",
+    "job_stockOffsetBottom",
+    "job_stockExpandX",
+    "job_stockExpandY",
+    "job_stockExpandZ",
+    "job_stockDiameter",
+    "job_stockLength",
+    "job_stockType",
+]
+
+# Feeds and speeds read together by operation summaries and tool presets.
+FEED_SPEED_PARAMS = FEED_PARAMS | SPEED_PARAMS
+
+# (param_name, output_group) pairs for operation summaries and tool
+# presets, flattened so both groups are read in one loop.
+_SUMMARY_PARAM_GROUPS = tuple(
+    [(key, "feedsAndSpeeds") for key in FEED_SPEED_PARAMS]
+    + [(key, "engagement") for key in ENGAGEMENT_PARAMS]
+)
+
+# Operation parameters that are safe to write (feeds, speeds, engagement).
+WRITABLE_OPERATION_PARAMS = FEED_SPEED_PARAMS | ENGAGEMENT_PARAMS
+
+# Machine-level setup parameters that are safe to update.
+MACHINE_WRITABLE_PARAMS = {
+    "machine_dimension_x":         "Machine Dimension X",
+    "machine_dimension_y":         "Machine Dimension Y",
+    "machine_dimension_z":         "Machine Dimension Z",
+    "machineMaxTilt":              "Max Tilt Angle",
+}
+
+# Spindle parameters that can be written via _write_machine_spindle.
+SPINDLE_WRITABLE_PARAMS = {
+    "maxSpindleSpeed":  "Max Spindle Speed (RPM)",
+    "minSpindleSpeed":  "Min Spindle Speed (RPM)",
+    "spindlePower":     "Spindle Power (kW)",
+    "peakTorque":       "Peak Torque (Nm)",
+    "peakTorqueSpeed":  "Peak Torque Speed (RPM)",
+}
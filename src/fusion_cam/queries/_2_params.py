@@ -1,7 +1,10 @@
 # ──────────────────────────────────────────────────────────────────────
 # Parameter reading, writing, unit conversion, and diff building.
 #
-# Depends on: _1_base.py (constants, _safe_attr, _is_proxy_str)
+# Depends on: _0_constants.py (constants),
+#             _1_base.py (_request_cache, _MISSING, _safe_attr,
+#                         _is_proxy_str),
+#             _3_lookups.py (_get_document; looked up at call time)
 # ──────────────────────────────────────────────────────────────────────
 
 # FloatParameterValueTypes enum → internal unit string.
@@ -34,62 +37,115 @@ _CAM_DISPLAY_UNITS = {
     11: ("C", "C"),
 }
 
-_um_cache = {}
-_imperial_cache = {}
+# Non-finite floats are returned as strings ("nan", "inf"); compare
+# against constants (and val != val for NaN) instead of math calls.
+_INF = float("inf")
+_NINF = float("-inf")
 
 
-def _get_document_units(doc):
-    """Get display units for a document as a short string (mm, in, etc.)."""
+def _get_design(doc):
+    """Return the document's Design product, or None.
+
+    Memoized in _request_cache per document object, compared by identity.
+    Callers pass the proxy from _get_document() (the unit helpers below
+    default to it too), which is cached for the request / execute_many
+    batch, so units, units-manager and body lookups on one document share
+    a single itemByProductType + cast.
+    """
+    if doc is None:
+        return None
+    entries = _request_cache.setdefault("designs", [])
+    for cached_doc, design in entries:
+        if cached_doc is doc:
+            return design
     try:
         design = adsk.fusion.Design.cast(
-            doc.products.itemByProductType("DesignProductType")
+            doc.products.itemByProductType(DESIGN_PRODUCT_TYPE)
         )
-        if design and design.fusionUnitsManager:
-            dist_units = design.fusionUnitsManager.distanceDisplayUnits
-            return DISTANCE_UNIT_MAP.get(dist_units, str(dist_units))
+    except Exception:
+        design = None
+    entries.append((doc, design))
+    return design
+
+
+def _get_document_units(doc):
+    """Get display units for a document as a short string (mm, in, etc.).
+
+    Memoized in _request_cache per document object like _get_design, so
+    the scripts of one execute_many batch that resolve the document via
+    _get_document() read the units only once.
+    """
+    entries = _request_cache.setdefault("doc_units", [])
+    for cached_doc, units in entries:
+        if cached_doc is doc:
+            return units
+    units = "unknown"
+    try:
+        design = _get_design(doc)
+        fum = design.fusionUnitsManager if design else None
+        if fum:
+            dist_units = fum.distanceDisplayUnits
+            units = DISTANCE_UNIT_MAP.get(dist_units, str(dist_units))
     except Exception:
         pass
-    return "unknown"
+    entries.append((doc, units))
+    return units
 
 
-def _get_units_manager():
-    """Get the active document's UnitsManager, cached per query execution."""
+def _get_units_manager(doc=None):
+    """Get a document's UnitsManager (default: the active document)."""
     try:
-        app = adsk.core.Application.get()
-        doc = app.activeDocument
-        doc_id = id(doc)
-        if doc_id not in _um_cache:
-            um = None
-            design = adsk.fusion.Design.cast(
-                doc.products.itemByProductType("DesignProductType")
-            )
-            if design:
-                um = design.unitsManager
-            else:
-                cam = adsk.cam.CAM.cast(
-                    doc.products.itemByProductType(CAM_PRODUCT_TYPE)
-                )
-                if cam:
-                    um = cam.unitsManager
-            _um_cache[doc_id] = um
-        return _um_cache.get(doc_id)
+        if doc is None:
+            doc, _ = _get_document()
+        design = _get_design(doc)
+        if design:
+            return design.unitsManager
+        cam = adsk.cam.CAM.cast(
+            doc.products.itemByProductType(CAM_PRODUCT_TYPE)
+        )
+        if cam:
+            return cam.unitsManager
     except Exception:
-        return None
+        pass
+    return None
 
 
-def _is_imperial():
-    """Check if the active document uses imperial distance units, cached."""
+def _is_imperial(doc=None):
+    """Check if a document (default: the active one) uses imperial distance units."""
     try:
-        app = adsk.core.Application.get()
-        doc = app.activeDocument
-        doc_id = id(doc)
-        if doc_id not in _imperial_cache:
-            _imperial_cache[doc_id] = _get_document_units(doc) in ("in", "ft")
-        return _imperial_cache[doc_id]
+        if doc is None:
+            doc, _ = _get_document()
+        return _get_document_units(doc) in ("in", "ft")
     except Exception:
         return False
 
 
+_unit_ctx = None
+
+
+def _get_unit_context():
+    """Return (units_manager, is_imperial) for the active document.
+
+    Resolved once per query execution (each script runs in a fresh
+    namespace, so this is the only units cache needed); hot parameter
+    loops use this, or pass the tuple as *ctx*, instead of looking the
+    active document up again for every float parameter.
+    """
+    global _unit_ctx
+    if _unit_ctx is None:
+        try:
+            # The cached proxy, so _get_design / _get_document_units
+            # memo entries are shared by every script in the batch.
+            doc, _ = _get_document()
+        except Exception:
+            doc = None
+        if doc is None:
+            _unit_ctx = (None, False)
+        else:
+            _unit_ctx = (_get_units_manager(doc), _is_imperial(doc))
+    return _unit_ctx
+
+
 def _param_label(param):
     """Get a human-readable label from a CAMParameter via its .title property.
 
@@ -103,11 +159,24 @@ def _param_label(param):
     return _safe_attr(param, "name") or "unknown"
 
 
-def _safe_param_value(param):
+_FloatParameterValue = adsk.cam.FloatParameterValue
+_ParameterValue = adsk.cam.ParameterValue
+
+
+def _param_expression(param):
+    """Return param.expression, or None if it cannot be read."""
+    try:
+        return param.expression
+    except Exception:
+        return None
+
+
+def _safe_param_value(param, ctx=None):
     """Safely extract a parameter value with display-unit conversion.
 
     Uses FloatParameterValue.type to determine the internal unit, then
-    UnitsManager.convert() to produce the display-unit value.
+    UnitsManager.convert() to produce the display-unit value. *ctx* is
+    the (units_manager, is_imperial) tuple from _get_unit_context().
 
     Returns:
       - For floats: {"value": display_number, "unit": "mm", "expression": "..."}
@@ -117,26 +186,34 @@ def _safe_param_value(param):
     """
     if param is None:
         return None
+    val_obj = _MISSING
     try:
-        expr = None
-        try:
-            expr = param.expression
-        except Exception:
-            pass
-
         val_obj = param.value
 
-        float_val = adsk.cam.FloatParameterValue.cast(val_obj)
+        # Swig normally hands back the concrete ParameterValue subclass, so
+        # an isinstance check settles float vs. bool/string/choice without
+        # a cast() round-trip; only a bare base-class proxy needs the cast.
+        if isinstance(val_obj, _FloatParameterValue):
+            float_val = val_obj
+        elif isinstance(val_obj, _ParameterValue) and type(val_obj) is not _ParameterValue:
+            float_val = None
+        else:
+            float_val = _FloatParameterValue.cast(val_obj)
         if float_val is not None:
+            expr = _param_expression(param)
             raw = float_val.value
-            if isinstance(raw, float) and (math.isnan(raw) or math.isinf(raw)):
+            if isinstance(raw, float) and (raw != raw or raw == _INF or raw == _NINF):
                 return str(raw)
             val_type = float_val.type
             internal_unit = _CAM_INTERNAL_UNITS.get(val_type)
             display_pair = _CAM_DISPLAY_UNITS.get(val_type)
             if internal_unit and display_pair:
-                target = display_pair[1] if _is_imperial() else display_pair[0]
-                um = _get_units_manager()
+                um, imperial = ctx or _get_unit_context()
+                target = display_pair[1] if imperial else display_pair[0]
+                if um and target == internal_unit:
+                    # rpm, deg, s, W, ... are stored in display units;
+                    # skip the convert() round-trip.
+                    return {"value": round(raw, 6), "unit": target, "expression": expr}
                 if um:
                     display_val = um.convert(raw, internal_unit, target)
                     if display_val != -1:
@@ -145,40 +222,133 @@ def _safe_param_value(param):
                 return {"value": raw, "unit": internal_unit, "expression": expr}
             return {"value": raw, "unit": None, "expression": expr}
 
-        if hasattr(val_obj, "value"):
-            val_obj = val_obj.value
+        val_obj = getattr(val_obj, "value", val_obj)
+
+        # Exact-type fast path for the concrete scalars Fusion returns;
+        # the isinstance chain below only handles subclasses and others.
+        t = type(val_obj)
+        if t is bool or t is str:
+            return val_obj
+        if t is int or t is float:
+            if t is float and (val_obj != val_obj or val_obj == _INF or val_obj == _NINF):
+                return str(val_obj)
+            expr = _param_expression(param)
+            return {"value": val_obj, "unit": None, "expression": expr if expr else str(val_obj)}
 
         if isinstance(val_obj, bool):
             return val_obj
         elif isinstance(val_obj, (int, float)):
-            if isinstance(val_obj, float) and (math.isnan(val_obj) or math.isinf(val_obj)):
+            if isinstance(val_obj, float) and (
+                val_obj != val_obj or val_obj == _INF or val_obj == _NINF
+            ):
                 return str(val_obj)
+            expr = _param_expression(param)
             return {"value": val_obj, "unit": None, "expression": expr if expr else str(val_obj)}
         elif isinstance(val_obj, str):
             return val_obj
         else:
             return str(val_obj) if val_obj is not None else None
     except Exception:
+        # A unit lookup or conversion failed after param.value was read;
+        # fall back to the raw value without reading param.value again.
+        # If param.value itself raised, a second read would fail too.
+        if val_obj is _MISSING:
+            return None
         try:
-            val = param.value
-            if hasattr(val, "value"):
-                val = val.value
-            return str(val) if val is not None else None
+            val = getattr(val_obj, "value", val_obj)
         except Exception:
             return None
+        return str(val) if val is not None else None
+
 
+def _raw_param_value(param):
+    """Return a parameter's raw internal value (no unit conversion), or None.
 
-def _read_param(params, name):
-    """Read a single parameter by name, returning None if not found."""
+    Unwraps ParameterValue.value with a single getattr instead of a
+    hasattr() probe followed by a second read.
+    """
+    if param is None:
+        return None
     try:
-        param = params.itemByName(name)
-        if param is None:
-            return None
-        return _safe_param_value(param)
+        val = param.value
+        return getattr(val, "value", val)
     except Exception:
         return None
 
 
+def _index_params(params):
+    """Enumerate a parameter collection once into a {name: param} dict.
+
+    Use this when a query already walks the whole collection: later reads
+    become dict lookups instead of one itemByName() Swig call per key.
+    The first parameter wins if a name repeats, matching itemByName().
+    """
+    index = {}
+    for p in _safe_iter(params):
+        try:
+            index.setdefault(p.name, p)
+        except Exception:
+            continue
+    return index
+
+
+def _read_param(params, name, cache=None, ctx=None):
+    """Read a single parameter by name, returning None if not found.
+
+    *params* is a Fusion parameter collection or an index built by
+    _index_params. Pass a *cache* dict to memoize values by name when the
+    same collection is read more than once (e.g. summary + details); it
+    must only ever be used with one collection. *ctx* is passed through
+    to _safe_param_value.
+    """
+    if cache is not None and name in cache:
+        return cache[name]
+    try:
+        if isinstance(params, dict):
+            param = params.get(name)
+        else:
+            param = params.itemByName(name)
+        val = None if param is None else _safe_param_value(param, ctx)
+    except Exception:
+        val = None
+    if cache is not None:
+        cache[name] = val
+    return val
+
+
+def _read_params(params, names, cache=None):
+    """Read *names* into a {name: value} dict, skipping missing values.
+
+    One loop with the unit context resolved once; *params* and *cache*
+    are as for _read_param.
+    """
+    ctx = _get_unit_context()
+    out = {}
+    for name in names:
+        val = _read_param(params, name, cache, ctx)
+        if val is not None:
+            out[name] = val
+    return out
+
+
+def _read_param_groups(params, pairs, cache=None):
+    """Read (name, group) *pairs* into {group: {name: value}} in one loop.
+
+    Groups with no values are left out; groups and names keep *pairs*
+    order. *params* and *cache* are as for _read_param.
+    """
+    ctx = _get_unit_context()
+    groups = {}
+    for name, group in pairs:
+        val = _read_param(params, name, cache, ctx)
+        if val is not None:
+            bucket = groups.get(group)
+            if bucket is None:
+                bucket = groups[group] = {}
+            bucket[name] = val
+    return groups
+
+
 def _numval(v):
     """Unwrap a value that may be a dict (from _safe_param_value) or a bare number."""
     if isinstance(v, dict):
@@ -190,11 +360,13 @@ def _numval(v):
 # Write helpers
 # ──────────────────────────────────────────────────────────────────────
 
-def _capture_param_snapshot(params_obj, param_names):
+def _capture_param_snapshot(params_obj, param_names, ctx=None):
     """Snapshot current parameter values for before/after comparison."""
+    if ctx is None:
+        ctx = _get_unit_context()
     snapshot = {}
     for name in param_names:
-        val = _read_param(params_obj, name)
+        val = _read_param(params_obj, name, ctx=ctx)
         if val is not None:
             snapshot[name] = val
     return snapshot
@@ -222,15 +394,29 @@ def _build_diff(before_snapshot, after_snapshot, params_obj=None, label_map=None
     Labels are resolved from *params_obj* (Fusion parameter collection,
     using _param_label) when available, falling back to *label_map* dict,
     then to the parameter name itself.
+
+    Resolved titles are memoized by parameter name in _request_cache, so
+    an execute_many batch of writes reads each title once.
     """
+    labels = _request_cache.setdefault("param_labels", {})
+    # Find the (usually few) changed keys first and sort only those.
+    changed = [
+        key for key, before_val in before_snapshot.items()
+        if after_snapshot.get(key) != before_val
+    ]
+    changed.extend(
+        key for key, after_val in after_snapshot.items()
+        if key not in before_snapshot and after_val is not None
+    )
+    changed.sort()
+
     changes = []
-    all_keys = set(before_snapshot.keys()) | set(after_snapshot.keys())
-    for key in sorted(all_keys):
-        before_val = before_snapshot.get(key)
-        after_val = after_snapshot.get(key)
-        if before_val != after_val:
-            label = key
-            if params_obj:
+    for key in changed:
+        label = key
+        if params_obj:
+            label = labels.get(key)
+            if label is None:
+                label = key
                 p = None
                 try:
                     p = params_obj.itemByName(key)
@@ -238,12 +424,13 @@ def _build_diff(before_snapshot, after_snapshot, params_obj=None, label_map=None
                     pass
                 if p:
                     label = _param_label(p)
-            if label == key and label_map:
-                label = label_map.get(key, key)
-            changes.append({
-                "parameter": key,
-                "label": label,
-                "before": before_val,
-                "after": after_val,
-            })
+                    labels[key] = label
+        if label == key and label_map:
+            label = label_map.get(key, key)
+        changes.append({
+            "parameter": key,
+            "label": label,
+            "before": before_snapshot.get(key),
+            "after": after_snapshot.get(key),
+        })
     return changes
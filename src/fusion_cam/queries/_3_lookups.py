@@ -1,22 +1,54 @@
 # ──────────────────────────────────────────────────────────────────────
 # Document, CAM, and object lookup functions.
 #
-# Depends on: _1_base.py (CAM_PRODUCT_TYPE), _2_params.py (_get_document_units)
+# Depends on: _0_constants.py (CAM_PRODUCT_TYPE),
+#             _1_base.py (_request_cache, _safe_iter),
+#             _2_params.py (_get_design)
 # ──────────────────────────────────────────────────────────────────────
 
+def _cached_valid(key):
+    """Return a cached Fusion object from _request_cache if it is still valid.
+
+    Stale entries (e.g. a document closed by an earlier script in the same
+    batch) are dropped so the caller falls back to a fresh lookup.
+    """
+    obj = _request_cache.get(key)
+    if obj is None:
+        return None
+    try:
+        if obj.isValid:
+            return obj
+    except Exception:
+        pass
+    _request_cache.pop(key, None)
+    return None
+
+
 def _get_document(document_name=None):
     """Get a document by name, or the active document.
     Returns (document, error_dict) tuple.
+
+    Successful lookups are cached in _request_cache for the rest of the
+    request / execute_many batch.
     """
+    key = ("doc", document_name)
+    doc = _cached_valid(key)
+    if doc is not None:
+        return doc, None
+
     app = adsk.core.Application.get()
     if not app:
         return None, {"success": False, "error": "Fusion 360 application not available"}
 
     if document_name:
+        # Collect names while searching so a miss needs no second pass.
+        available = []
         for doc in _safe_iter(app.documents):
-            if doc.name == document_name:
+            name = doc.name
+            if name == document_name:
+                _request_cache[key] = doc
                 return doc, None
-        available = [d.name for d in _safe_iter(app.documents)]
+            available.append(name)
         return None, {
             "success": False,
             "error": f"Document '{document_name}' not found. Open documents: {available}. "
@@ -26,13 +58,23 @@ def _get_document(document_name=None):
         doc = app.activeDocument
         if not doc:
             return None, {"success": False, "error": "No document is open in Fusion 360"}
+        _request_cache[key] = doc
         return doc, None
 
 
 def _get_cam(document_name=None):
     """Get a CAM product, optionally from a specific document.
     Returns (cam, error_dict) tuple.
+
+    The CAM product is cached in _request_cache, so every script in an
+    execute_many batch shares one lookup per document; a cached product
+    that is no longer valid is looked up again.
     """
+    key = ("cam", document_name)
+    cam = _cached_valid(key)
+    if cam is not None:
+        return cam, None
+
     doc, err = _get_document(document_name)
     if err:
         return None, err
@@ -52,37 +94,124 @@ def _get_cam(document_name=None):
     if not cam:
         return None, {"success": False, "error": "Failed to cast to CAM product"}
 
+    _request_cache[key] = cam
     return cam, None
 
 
+def _setups_list(cam):
+    """Snapshot cam.setups once per request.
+
+    Cached in _request_cache (keyed by the CAM product, which the cache
+    keeps alive), so an execute_many batch walks the setups once.
+    """
+    key = ("setups", id(cam))
+    entry = _request_cache.get(key)
+    if entry is None or entry[0] is not cam:
+        entry = (cam, list(_safe_iter(cam.setups)))
+        _request_cache[key] = entry
+    return entry[1]
+
+
+def _setup_map(cam):
+    """Return a cached {setup_name: setup} dict; the first setup wins on duplicate names."""
+    key = ("setup_map", id(cam))
+    entry = _request_cache.get(key)
+    if entry is None or entry[0] is not cam:
+        by_name = {}
+        for setup in _setups_list(cam):
+            by_name.setdefault(setup.name, setup)
+        entry = (cam, by_name)
+        _request_cache[key] = entry
+    return entry[1]
+
+
 def _find_setup_by_name(cam, name):
     """Find a setup by name. Returns (setup, error_dict) tuple."""
-    for setup in cam.setups:
-        if setup.name == name:
-            return setup, None
+    setup = _setup_map(cam).get(name)
+    if setup is not None:
+        return setup, None
     return None, {
         "success": False,
         "error": f"Setup '{name}' not found. Use get_setups to list available setups."
     }
 
 
+def _lookup_operation(owner, operation_name):
+    """Return the first operation named *operation_name* in owner.allOperations, or None.
+
+    *owner* is the CAM product or a setup. Like _find_material_in_library
+    the scan is resumable: names seen so far are kept in _request_cache
+    with the next index to read, so a single lookup still stops at the
+    match and later lookups in a request / execute_many batch only
+    continue the walk as far as they need to.
+
+    Batches may also contain writes, so the index is rebuilt when the live
+    operation count changes, a cached hit is re-checked (isValid and name)
+    before it is returned, and a miss in a partly reused index rescans.
+    """
+    try:
+        ops = owner.allOperations
+        count = ops.count
+    except Exception:
+        return None
+    key = ("op_scan", id(owner))
+    entry = _request_cache.get(key)
+    if entry is None or entry[0] is not owner or entry[4] != count:
+        # [owner, {name: op}, next index, bound item(), count]
+        entry = [owner, {}, 0, ops.item, count]
+        _request_cache[key] = entry
+
+    op = entry[1].get(operation_name)
+    if op is not None:
+        try:
+            if op.isValid and op.name == operation_name:
+                return op
+        except Exception:
+            pass
+        # Renamed or deleted by an earlier script: start a fresh index.
+        entry = [owner, {}, 0, ops.item, count]
+        _request_cache[key] = entry
+
+    while True:
+        by_name, item = entry[1], entry[3]
+        start = i = entry[2]
+        while i < count:
+            try:
+                op = item(i)
+                name = op.name
+            except Exception:
+                i += 1
+                continue
+            i += 1
+            by_name.setdefault(name, op)
+            if name == operation_name:
+                entry[2] = i
+                return by_name[name]
+        entry[2] = i
+        if start == 0:
+            return None
+        # Names indexed by earlier lookups may be stale; rescan once.
+        entry = [owner, {}, 0, ops.item, count]
+        _request_cache[key] = entry
+
+
 def _find_operation_by_name(cam, operation_name, setup_name=None):
     """Find an operation by name, optionally within a specific setup."""
     if setup_name:
         setup, err = _find_setup_by_name(cam, setup_name)
         if err:
             return None, err
-        for op in setup.allOperations:
-            if op.name == operation_name:
-                return op, None
+        op = _lookup_operation(setup, operation_name)
+        if op is not None:
+            return op, None
         return None, {
             "success": False,
             "error": f"Operation '{operation_name}' not found in setup '{setup_name}'."
         }
     else:
-        for op in cam.allOperations:
-            if op.name == operation_name:
-                return op, None
+        op = _lookup_operation(cam, operation_name)
+        if op is not None:
+            return op, None
         return None, {
             "success": False,
             "error": f"Operation '{operation_name}' not found. Use get_operations to list available operations."
@@ -92,15 +221,26 @@ def _find_operation_by_name(cam, operation_name, setup_name=None):
 def _find_library_by_name(library_name):
     """Find a material library by name.
     Returns (library, error_dict) tuple.
+
+    Found libraries are cached in _request_cache for the rest of the
+    request / execute_many batch; a cached library that is no longer valid
+    is looked up again.
     """
+    key = ("material_lib", library_name)
+    lib = _cached_valid(key)
+    if lib is not None:
+        return lib, None
+
     app = adsk.core.Application.get()
     if not app:
         return None, {"success": False, "error": "Fusion 360 application not available"}
-    mat_libs = app.materialLibraries
-    for lib in _safe_iter(mat_libs):
-        if lib.name == library_name:
+    available = []
+    for lib in _safe_iter(app.materialLibraries):
+        name = lib.name
+        if name == library_name:
+            _request_cache[key] = lib
             return lib, None
-    available = [lib.name for lib in _safe_iter(mat_libs)]
+        available.append(name)
     return None, {
         "success": False,
         "error": f"Material library '{library_name}' not found. "
@@ -111,13 +251,48 @@ def _find_library_by_name(library_name):
 def _find_material_in_library(library_name, material_name):
     """Find a material in a named library.
     Returns (material, error_dict) tuple.
+
+    Libraries can hold thousands of materials, so rather than indexing the
+    whole library up front the scan is resumable: names seen so far are
+    kept in _request_cache with the next index to read, and each lookup
+    only continues the walk as far as it needs to.
     """
     lib, err = _find_library_by_name(library_name)
     if err:
         return None, err
-    for mat in _safe_iter(lib.materials):
-        if mat.name == material_name:
-            return mat, None
+
+    key = ("material_scan", library_name)
+    entry = _request_cache.get(key)
+    if entry is None or entry[0] is not lib:
+        entry = [lib, {}, 0]
+        _request_cache[key] = entry
+    by_name = entry[1]
+
+    mat = by_name.get(material_name)
+    if mat is not None:
+        return mat, None
+
+    try:
+        materials = lib.materials
+        count = materials.count
+        item = materials.item
+    except Exception:
+        count = 0
+    i = entry[2]
+    while i < count:
+        try:
+            mat = item(i)
+            name = mat.name
+        except Exception:
+            i += 1
+            continue
+        i += 1
+        by_name.setdefault(name, mat)
+        if name == material_name:
+            entry[2] = i
+            return by_name[name], None
+    entry[2] = i
+
     return None, {
         "success": False,
         "error": f"Material '{material_name}' not found in library '{library_name}'. "
@@ -155,13 +330,9 @@ def _find_body_by_name(document_name=None, body_name=None, setup_name=None):
     doc, err = _get_document(document_name)
     if err:
         return None, err
-    try:
-        design = doc.products.itemByProductType("DesignProductType")
-    except RuntimeError:
-        design = None
+    design = _get_design(doc)
     if not design:
         return None, {"success": False, "error": "No Design workspace found in document."}
-    design = adsk.fusion.Design.cast(design)
     root = design.rootComponent
 
     def _search_component(comp):
@@ -174,8 +345,18 @@ def _find_body_by_name(document_name=None, body_name=None, setup_name=None):
     if found:
         return found, None
 
+    # allOccurrences lists every instance, so a component placed many
+    # times would be rescanned for each one; visit each component once,
+    # keyed by Component.id (proxy id() is not stable across Swig calls).
+    seen = set()
     for occ in _safe_iter(root.allOccurrences):
-        found = _search_component(occ.component)
+        comp = occ.component
+        comp_id = _safe_attr(comp, "id")
+        if comp_id is not None:
+            if comp_id in seen:
+                continue
+            seen.add(comp_id)
+        found = _search_component(comp)
         if found:
             return found, None
 
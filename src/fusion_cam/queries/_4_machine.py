@@ -1,7 +1,8 @@
 # ──────────────────────────────────────────────────────────────────────
 # Machine spindle access (read/write via kinematics tree).
 #
-# Depends on: _1_base.py (_safe_attr, _safe_iter, SPINDLE_WRITABLE_PARAMS)
+# Depends on: _0_constants.py (SPINDLE_WRITABLE_PARAMS),
+#             _1_base.py (_MISSING, _safe_attr, _safe_iter)
 # ──────────────────────────────────────────────────────────────────────
 
 def _find_spindle(machine_obj):
@@ -13,20 +14,18 @@ def _find_spindle(machine_obj):
     if not parts:
         return None
 
-    def _check_part(part):
+    # Pre-order DFS with an explicit stack of child iterators: same visit
+    # order as the old recursive walk, without a Python frame per part.
+    stack = [_safe_iter(parts)]
+    while stack:
+        part = next(stack[-1], _MISSING)
+        if part is _MISSING:
+            stack.pop()
+            continue
         sp = _safe_attr(part, "spindle")
         if sp:
             return sp
-        for child in _safe_iter(_safe_attr(part, "children")):
-            found = _check_part(child)
-            if found:
-                return found
-        return None
-
-    for part in _safe_iter(parts):
-        found = _check_part(part)
-        if found:
-            return found
+        stack.append(_safe_iter(_safe_attr(part, "children")))
     return None
 
 
@@ -59,6 +58,17 @@ def _read_machine_spindle(machine_obj):
     return data if data else None
 
 
+# Writable spindle parameter name -> MachineSpindle attribute.
+_SPINDLE_PARAM_MAP = {
+    "maxSpindleSpeed": "maxSpeed",
+    "minSpindleSpeed": "minSpeed",
+    "spindlePower": "power",
+    "peakTorque": "peakTorque",
+    "peakTorqueSpeed": "peakTorqueSpeed",
+}
+_SPINDLE_PARAM_NAMES = sorted(_SPINDLE_PARAM_MAP)
+
+
 def _write_machine_spindle(machine_obj, param_name, value):
     """Write a spindle parameter on the machine's kinematics tree.
 
@@ -69,23 +79,16 @@ def _write_machine_spindle(machine_obj, param_name, value):
     Returns:
         (success: bool, error_message: str or None)
     """
-    _SPINDLE_PARAM_MAP = {
-        "maxSpindleSpeed": "maxSpeed",
-        "minSpindleSpeed": "minSpeed",
-        "spindlePower": "power",
-        "peakTorque": "peakTorque",
-        "peakTorqueSpeed": "peakTorqueSpeed",
-    }
     attr_name = _SPINDLE_PARAM_MAP.get(param_name)
     if not attr_name:
-        return False, f"Unknown spindle parameter '{param_name}'. Valid: {sorted(_SPINDLE_PARAM_MAP.keys())}"
+        return False, f"Unknown spindle parameter '{param_name}'. Valid: {_SPINDLE_PARAM_NAMES}"
 
     spindle = _find_spindle(machine_obj)
     if not spindle:
         return False, "No spindle found in machine kinematics tree"
 
     try:
-        setattr(spindle, attr_name, float(value))
+        setattr(spindle, attr_name, value if type(value) is float else float(value))
         return True, None
     except Exception as e:
         return False, f"Failed to set spindle.{attr_name}: {e}"
@@ -1,23 +1,24 @@
 # ──────────────────────────────────────────────────────────────────────
 # Tool, preset, and coolant helpers.
 #
-# Depends on: _1_base.py (param sets, _safe_attr, _safe_iter, _is_proxy_str),
-#             _2_params.py (_read_param, _safe_param_value)
+# Depends on: _0_constants.py (param sets),
+#             _1_base.py (_MISSING, _safe_attr, _safe_iter, _is_proxy_str),
+#             _2_params.py (_read_param, _read_params, _read_param_groups,
+#                          _safe_param_value)
 # ──────────────────────────────────────────────────────────────────────
 
-def _get_tool_info(op):
-    """Extract tool information from an operation, including holder and coolant."""
-    tool = _safe_attr(op, "tool")
+def _get_tool_info(op, tool=_MISSING):
+    """Extract tool information from an operation, including holder and coolant.
+
+    Pass *tool* when the caller has already read op.tool.
+    """
+    if tool is _MISSING:
+        tool = _safe_attr(op, "tool")
     if not tool:
         return None
 
     try:
-        tool_params = tool.parameters
-        info = {}
-        for key in TOOL_GEOM_PARAMS:
-            val = _read_param(tool_params, key)
-            if val is not None:
-                info[key] = val
+        info = _read_params(tool.parameters, TOOL_GEOM_PARAMS)
 
         type_name = _safe_attr(tool, "type")
         if type_name is not None:
@@ -63,39 +64,34 @@ def _get_tool_presets(tool):
 
         pp = _safe_attr(preset, "parameters")
         if pp:
-            fs = {}
-            for key in FEED_PARAMS | SPEED_PARAMS:
-                val = _read_param(pp, key)
-                if val is not None:
-                    fs[key] = val
-            if fs:
-                entry["feedsAndSpeeds"] = fs
-
-            eng = {}
-            for key in ENGAGEMENT_PARAMS:
-                val = _read_param(pp, key)
-                if val is not None:
-                    eng[key] = val
-            if eng:
-                entry["engagement"] = eng
+            entry.update(_read_param_groups(pp, _SUMMARY_PARAM_GROUPS))
 
         if entry:
             presets.append(entry)
     return presets
 
 
-def _get_coolant_info(op):
-    """Extract coolant mode from an operation."""
-    def _extract(val):
-        if val is None:
-            return None
-        if isinstance(val, dict):
-            return val.get("expression", str(val.get("value")))
+def _coolant_str(val):
+    """Render a tool_coolant value (param dict or plain value) as a string."""
+    if val is None:
+        return None
+    try:
+        # Parameter values are almost always dicts here.
+        expr = val.get("expression")
+    except AttributeError:
         return str(val)
+    return expr if expr is not None else str(val.get("value"))
 
-    tool = _safe_attr(op, "tool")
+
+def _get_coolant_info(op, tool=_MISSING):
+    """Extract coolant mode from an operation.
+
+    Pass *tool* when the caller has already read op.tool.
+    """
+    if tool is _MISSING:
+        tool = _safe_attr(op, "tool")
     if tool:
-        result = _extract(_read_param(_safe_attr(tool, "parameters"), "tool_coolant"))
+        result = _coolant_str(_read_param(_safe_attr(tool, "parameters"), "tool_coolant"))
         if result:
             return result
-    return _extract(_read_param(_safe_attr(op, "parameters"), "tool_coolant"))
+    return _coolant_str(_read_param(_safe_attr(op, "parameters"), "tool_coolant"))
@@ -1,19 +1,32 @@
 # ──────────────────────────────────────────────────────────────────────
 # Operation summary, folder map, material properties, and misc helpers.
 #
-# Depends on: _1_base.py (constants, _safe_attr, _safe_iter),
-#             _2_params.py (_read_param),
+# Depends on: _0_constants.py (constants),
+#             _1_base.py (_MISSING, _safe_attr, _safe_iter),
+#             _2_params.py (_read_param_groups),
 #             _5_tools.py (_get_tool_info, _get_coolant_info)
 # ──────────────────────────────────────────────────────────────────────
 
-def _get_operation_summary(op):
-    """Build a summary dict for an operation."""
-    op_params = op.parameters
+def _setup_op_type(setup):
+    """Map a setup's operationType to "milling", "turning", etc. (or None)."""
+    if not setup:
+        return None
+    return OPERATION_TYPE_MAP.get(_safe_attr(setup, "operationType"), None)
 
-    parent = _safe_attr(op, "parentSetup")
-    op_type = OPERATION_TYPE_MAP.get(
-        _safe_attr(parent, "operationType"), None
-    ) if parent else None
+
+def _get_operation_summary(op, param_index=None, value_cache=None, op_type=_MISSING):
+    """Build a summary dict for an operation.
+
+    Pass *param_index* (from _index_params) when the caller has already
+    enumerated the operation's parameters, and *value_cache* (see
+    _read_param) when it will read the same values again. Callers walking
+    a setup's operations pass *op_type* (from _setup_op_type) once for all
+    of them instead of re-reading op.parentSetup per operation.
+    """
+    op_params = param_index if param_index is not None else op.parameters
+
+    if op_type is _MISSING:
+        op_type = _setup_op_type(_safe_attr(op, "parentSetup"))
 
     summary = {
         "name": op.name,
@@ -27,29 +40,18 @@ def _get_operation_summary(op):
     if notes:
         summary["notes"] = notes
 
-    tool_info = _get_tool_info(op)
+    # Read op.tool once for both helpers.
+    tool = _safe_attr(op, "tool")
+    tool_info = _get_tool_info(op, tool)
     if tool_info:
         summary["tool"] = tool_info
 
-    coolant = _get_coolant_info(op)
+    coolant = _get_coolant_info(op, tool)
     if coolant:
         summary["coolant"] = coolant
 
-    feeds_speeds = {}
-    for key in FEED_PARAMS | SPEED_PARAMS:
-        val = _read_param(op_params, key)
-        if val is not None:
-            feeds_speeds[key] = val
-    if feeds_speeds:
-        summary["feedsAndSpeeds"] = feeds_speeds
-
-    engagement = {}
-    for key in ENGAGEMENT_PARAMS:
-        val = _read_param(op_params, key)
-        if val is not None:
-            engagement[key] = val
-    if engagement:
-        summary["engagement"] = engagement
+    # "feedsAndSpeeds" and "engagement", when present.
+    summary.update(_read_param_groups(op_params, _SUMMARY_PARAM_GROUPS, value_cache))
 
     if op.hasToolpath:
         valid = _safe_attr(op, "isToolpathValid")
@@ -67,19 +69,57 @@ def _build_folder_map(setup):
     Operations at the setup root have no entry in the map.
     """
     folder_map = {}
+    folder_cls = adsk.cam.CAMFolder
+    op_cls = adsk.cam.Operation
+    folder_cast = folder_cls.cast
+    op_cast = op_cls.cast
+    base_cls = adsk.core.Base
+    # Declared types Swig may hand back for a setup child without
+    # resolving the concrete class; those still need a cast().
+    bare_types = (adsk.cam.OperationBase, base_cls)
+
+    # Iterative DFS; visit order matches the old recursive walk. Each
+    # frame is [children iterator, path segments, joined path]. The
+    # "a/b/c" string is only built, once, for folders that directly
+    # contain operations.
+    stack = [[_safe_iter(_safe_attr(setup, "children")), (), None]]
+    while stack:
+        frame = stack[-1]
+        child = next(frame[0], _MISSING)
+        if child is _MISSING:
+            stack.pop()
+            continue
+        # Swig normally returns the concrete class, so isinstance settles
+        # folder vs. operation without a cast() round-trip; only a bare
+        # OperationBase / Base proxy falls back to casting.
+        if isinstance(child, folder_cls):
+            child_folder = child
+        elif isinstance(child, base_cls) and type(child) not in bare_types:
+            child_folder = None
+        else:
+            child_folder = folder_cast(child)
+        if child_folder:
+            stack.append([
+                _safe_iter(_safe_attr(child_folder, "children")),
+                frame[1] + (child_folder.name,),
+                None,
+            ])
+            continue
+        if not frame[1]:
+            # Root-level operations get no entry; skip the Operation cast.
+            continue
+        if isinstance(child, op_cls):
+            child_op = child
+        elif isinstance(child, base_cls) and type(child) not in bare_types:
+            continue
+        else:
+            child_op = op_cast(child)
+        if child_op:
+            path = frame[2]
+            if path is None:
+                path = frame[2] = "/".join(frame[1])
+            folder_map[child_op.name] = path
 
-    def _walk(children, path):
-        for child in _safe_iter(children):
-            child_folder = adsk.cam.CAMFolder.cast(child)
-            if child_folder:
-                sub_path = f"{path}/{child_folder.name}" if path else child_folder.name
-                _walk(_safe_attr(child_folder, "children"), sub_path)
-                continue
-            child_op = adsk.cam.Operation.cast(child)
-            if child_op and path:
-                folder_map[child_op.name] = path
-
-    _walk(_safe_attr(setup, "children"), "")
     return folder_map
 
 
@@ -95,9 +135,8 @@ def _read_all_material_properties(material):
             p_info["id"] = pid
         try:
             val = p.value
-            if isinstance(val, bool):
-                p_info["value"] = val
-            elif isinstance(val, (int, float)):
+            # bool is an int subclass, so this also passes booleans through.
+            if isinstance(val, (int, float)):
                 p_info["value"] = val
             elif val is not None:
                 p_info["value"] = str(val)
@@ -136,17 +175,18 @@ def _check_no_active_command():
 
 
 def _format_time(seconds):
-    """Format seconds into a human-readable string."""
-    if seconds is None or seconds == 0:
+    """Format seconds into a human-readable string (zero components are omitted)."""
+    if not seconds:
         return "0s"
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    parts = []
+    hours, rem = divmod(int(seconds), 3600)
+    minutes, secs = divmod(rem, 60)
     if hours:
-        parts.append(f"{hours}h")
+        out = f"{hours}h"
+        if minutes:
+            out += f" {minutes}m"
+        if secs:
+            out += f" {secs}s"
+        return out
     if minutes:
-        parts.append(f"{minutes}m")
-    if secs or not parts:
-        parts.append(f"{secs}s")
-    return " ".join(parts)
+        return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+    return f"{secs}s"
@@ -45,13 +45,9 @@ def run(params):
     if err:
         return err
 
-    try:
-        design = doc.products.itemByProductType("DesignProductType")
-    except RuntimeError:
-        design = None
+    design = _get_design(doc)
     if not design:
         return {"success": False, "error": "No Design workspace found"}
-    design = adsk.fusion.Design.cast(design)
 
     # Check if material already exists in design
     new_mat = None
@@ -171,23 +167,23 @@ def _try_create_material(mat_libs, source_mat, name, design):
     """Try creating a material in Custom Library, Favorites, or Design."""
     errors = []
 
-    for i in range(mat_libs.count):
-        if mat_libs.item(i).name == "Custom Library":
-            try:
-                new_mat = mat_libs.item(i).materials.addByCopy(source_mat, name)
-                return new_mat, "Custom Library", errors
-            except Exception as e:
-                errors.append(f"Custom Library addByCopy: {e}")
-            break
-
-    for i in range(mat_libs.count):
-        if mat_libs.item(i).name == "Favorites Library":
-            try:
-                new_mat = mat_libs.item(i).materials.addByCopy(source_mat, name)
-                return new_mat, "Favorites Library", errors
-            except Exception as e:
-                errors.append(f"Favorites Library addByCopy: {e}")
-            break
+    # One pass over the libraries picks up both targets.
+    targets = {"Custom Library": None, "Favorites Library": None}
+    for lib in _safe_iter(mat_libs):
+        lib_name = lib.name
+        if lib_name in targets and targets[lib_name] is None:
+            targets[lib_name] = lib
+            if all(targets.values()):
+                break
+
+    for lib_name, lib in targets.items():
+        if lib is None:
+            continue
+        try:
+            new_mat = lib.materials.addByCopy(source_mat, name)
+            return new_mat, lib_name, errors
+        except Exception as e:
+            errors.append(f"{lib_name} addByCopy: {e}")
 
     try:
         new_mat = design.materials.addByCopy(source_mat, name)
@@ -32,13 +32,11 @@ def run(params):
         setup, err = _find_setup_by_name(cam, setup_name)
         if err:
             return err
-        for i in range(setup.allOperations.count):
-            op = setup.allOperations.item(i)
+        for op in _ops_list(setup.allOperations):
             if not op.isSuppressed:
                 operations_to_generate.append(op)
     else:
-        for i in range(cam.allOperations.count):
-            op = cam.allOperations.item(i)
+        for op in _ops_list(cam.allOperations):
             if not op.isSuppressed:
                 operations_to_generate.append(op)
 
@@ -69,20 +67,24 @@ def run(params):
             adsk.doEvents()
 
         generated = []
+        completed_count = valid_count = 0
         for op in operations_to_generate:
+            has_toolpath = op.hasToolpath
             op_result = {
                 "name": op.name,
-                "hasToolpath": op.hasToolpath,
+                "hasToolpath": has_toolpath,
             }
-            try:
-                if op.hasToolpath:
-                    op_result["isToolpathValid"] = op.isToolpathValid
-            except Exception:
-                pass
+            if has_toolpath:
+                completed_count += 1
+                try:
+                    valid = op.isToolpathValid
+                    op_result["isToolpathValid"] = valid
+                    if valid:
+                        valid_count += 1
+                except Exception:
+                    pass
             generated.append(op_result)
 
-        completed_count = sum(1 for g in generated if g.get("hasToolpath"))
-        valid_count = sum(1 for g in generated if g.get("isToolpathValid"))
         timed_out = not future.isGenerationCompleted
 
         return {
@@ -22,8 +22,10 @@ def run(params):
         data["hasCAM"] = cam_product is not None
         if cam_product:
             cam = adsk.cam.CAM.cast(cam_product)
-            data["setupCount"] = cam.setups.count if cam.setups else 0
-            data["operationCount"] = cam.allOperations.count if cam.allOperations else 0
+            setups = cam.setups
+            all_ops = cam.allOperations
+            data["setupCount"] = setups.count if setups else 0
+            data["operationCount"] = all_ops.count if all_ops else 0
     except Exception:
         data["hasCAM"] = False
 
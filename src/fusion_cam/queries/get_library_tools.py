@@ -59,10 +59,7 @@ def _extract_tool_record(tool, min_dia, max_dia, tool_type_filter):
     info = {}
     try:
         params = tool.parameters
-        for key in TOOL_GEOM_PARAMS:
-            val = _read_param(params, key)
-            if val is not None:
-                info[key] = val
+        info = _read_params(params, TOOL_GEOM_PARAMS)
 
         type_name = _safe_attr(tool, "type")
         if type_name is not None:
@@ -7,6 +7,66 @@
 # Result: {setups: [...]}
 # ──────────────────────────────────────────────────────────────────────
 
+# Candidate spellings for the MachiningTime result attributes, probed in
+# order on every result.
+_RAPID_TIME_ATTRS = ("rapidTime", "rapid_time", "rapidtime")
+_TOTAL_TIME_ATTRS = ("totalTime", "total_time", "totaltime")
+
+_FEED_SCALE = 1.0  # report programmed feeds (100%)
+
+
+def _op_machining_time(cam, op, rapid_feed, tool_change_time):
+    """Build the time entry for one operation."""
+    has_toolpath = op.hasToolpath
+    is_suppressed = op.isSuppressed
+    op_time = {
+        "name": op.name,
+        "isSuppressed": is_suppressed,
+        "hasToolpath": has_toolpath,
+    }
+
+    if has_toolpath and not is_suppressed:
+        try:
+            time_result = cam.getMachiningTime(op, _FEED_SCALE, rapid_feed, tool_change_time)
+            if time_result:
+                mach_time = getattr(time_result, "machiningTime", None)
+                if mach_time is not None:
+                    op_time["machiningTimeSeconds"] = mach_time
+                for attr_name in _RAPID_TIME_ATTRS:
+                    rapid = getattr(time_result, attr_name, None)
+                    if rapid is not None:
+                        op_time["rapidTimeSeconds"] = rapid
+                        break
+                for attr_name in _TOTAL_TIME_ATTRS:
+                    total = getattr(time_result, attr_name, None)
+                    if total is not None:
+                        op_time["totalTimeSeconds"] = total
+                        op_time["totalTimeFormatted"] = _format_time(total)
+                        break
+                if "totalTimeSeconds" not in op_time and mach_time is not None:
+                    op_time["totalTimeSeconds"] = mach_time
+                    op_time["totalTimeFormatted"] = _format_time(mach_time)
+        except Exception as e:
+            op_time["timeError"] = str(e)
+
+    return op_time
+
+
+def _setup_machining_time(cam, setup, rapid_feed, tool_change_time):
+    """Build the time entry for one setup, with per-operation times and a total."""
+    operations = [
+        _op_machining_time(cam, op, rapid_feed, tool_change_time)
+        for op in _ops_list(setup.allOperations)
+    ]
+    total = sum(op.get("totalTimeSeconds", 0) for op in operations)
+    return {
+        "setupName": setup.name,
+        "operations": operations,
+        "totalTimeSeconds": total,
+        "totalTimeFormatted": _format_time(total),
+    }
+
+
 def run(params):
     document_name = params.get("document_name")
     cam, err = _get_cam(document_name)
@@ -21,59 +81,14 @@ def run(params):
             return err
         setups_to_check = [setup]
     else:
-        setups_to_check = [cam.setups.item(i) for i in range(cam.setups.count)]
-
-    results = []
-    for setup in setups_to_check:
-        setup_data = {
-            "setupName": setup.name,
-            "operations": []
-        }
-
-        for i in range(setup.allOperations.count):
-            op = setup.allOperations.item(i)
-            op_time = {
-                "name": op.name,
-                "isSuppressed": op.isSuppressed,
-                "hasToolpath": op.hasToolpath,
-            }
-
-            if op.hasToolpath and not op.isSuppressed:
-                try:
-                    feed_scale = 1.0
-                    rapid_feed = params.get("rapid_feed", DEFAULT_RAPID_FEED)
-                    tool_change_time = params.get("tool_change_time", DEFAULT_TOOL_CHANGE_TIME)
-                    time_result = cam.getMachiningTime(op, feed_scale, rapid_feed, tool_change_time)
-                    if time_result:
-                        mach_time = getattr(time_result, "machiningTime", None)
-                        if mach_time is not None:
-                            op_time["machiningTimeSeconds"] = mach_time
-                        for attr_name in ["rapidTime", "rapid_time", "rapidtime"]:
-                            rapid = getattr(time_result, attr_name, None)
-                            if rapid is not None:
-                                op_time["rapidTimeSeconds"] = rapid
-                                break
-                        for attr_name in ["totalTime", "total_time", "totaltime"]:
-                            total = getattr(time_result, attr_name, None)
-                            if total is not None:
-                                op_time["totalTimeSeconds"] = total
-                                op_time["totalTimeFormatted"] = _format_time(total)
-                                break
-                        if "totalTimeSeconds" not in op_time and mach_time is not None:
-                            op_time["totalTimeSeconds"] = mach_time
-                            op_time["totalTimeFormatted"] = _format_time(mach_time)
-                except Exception as e:
-                    op_time["timeError"] = str(e)
-
-            setup_data["operations"].append(op_time)
+        setups_to_check = _setups_list(cam)
 
-        total = sum(
-            op.get("totalTimeSeconds", 0)
-            for op in setup_data["operations"]
-        )
-        setup_data["totalTimeSeconds"] = total
-        setup_data["totalTimeFormatted"] = _format_time(total)
+    rapid_feed = params.get("rapid_feed", DEFAULT_RAPID_FEED)
+    tool_change_time = params.get("tool_change_time", DEFAULT_TOOL_CHANGE_TIME)
 
-        results.append(setup_data)
+    results = [
+        _setup_machining_time(cam, setup, rapid_feed, tool_change_time)
+        for setup in setups_to_check
+    ]
 
     return {"setups": results}
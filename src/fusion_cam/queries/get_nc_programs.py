@@ -35,12 +35,7 @@ def run(params):
 
         post_config = _safe_attr(nc, "postConfiguration")
         if post_config:
-            post_info = {
-                k: v for k, v in {
-                    "name": _safe_attr(post_config, "name"),
-                    "description": _safe_attr(post_config, "description"),
-                }.items() if v is not None
-            }
+            post_info = _safe_attrs(post_config, ("name", "description"))
             url_obj = _safe_attr(post_config, "postURL")
             if url_obj:
                 url_str = _safe_attr(url_obj, "toString")
@@ -7,6 +7,15 @@
 # Result: full operation details dict with parameters and computed metrics
 # ──────────────────────────────────────────────────────────────────────
 
+import math
+
+# Fixed unit factors for the computed metrics (exact by definition, so no
+# UnitsManager.convert() round trips are needed).
+_MM_PER_CM = 10.0
+_FT_PER_M = 1 / 0.3048
+_IN_PER_MM = 1 / 25.4
+
+
 def run(params):
     document_name = params.get("document_name")
     cam, err = _get_cam(document_name)
@@ -22,20 +31,24 @@ def run(params):
     if err:
         return err
 
-    details = _get_operation_summary(op)
+    # Enumerate the parameters once; every read below is a dict lookup.
+    # value_cache lets the category dump reuse the values the summary read.
+    param_index = _index_params(op.parameters)
+    value_cache = {}
+
+    details = _get_operation_summary(op, param_index, value_cache)
 
     # Full parameter dump by category
-    op_params = op.parameters
     all_parameters = {}
 
-    for category, param_set in ALL_PARAM_CATEGORIES.items():
+    for category, param_set in _CATEGORY_ITEMS:
         cat_data = {}
         for key in param_set:
             try:
-                p = op_params.itemByName(key)
+                p = param_index.get(key)
                 if p is None:
                     continue
-                val = _safe_param_value(p)
+                val = _read_param(param_index, key, value_cache)
                 if val is None:
                     continue
                 entry = {"label": _param_label(p), "value": val}
@@ -52,9 +65,8 @@ def run(params):
             all_parameters[category] = cat_data
 
     # Auto-categorize parameters not in the explicit sets
-    for p in _safe_iter(op_params):
-        name = p.name
-        if name in ALL_KNOWN_PARAMS:
+    for name, p in param_index.items():
+        if name in _ALL_KNOWN_PARAM_NAMES:
             continue
         visible = _safe_attr(p, "isVisible")
         if visible is not None and not visible:
@@ -66,36 +78,34 @@ def run(params):
 
     details["parameters"] = all_parameters
 
-    # Computed metrics using UnitsManager.convert() for all unit math.
+    # Computed metrics from raw internal values (cm, mm/min, rpm).
     computed = {}
     try:
-        um = cam.unitsManager
-
         def _raw(param_set, name):
-            """Read raw internal .value from a parameter set."""
+            """Read raw internal .value from a parameter set or index."""
             try:
-                p = param_set.itemByName(name)
-                if p is None:
-                    return None
-                v = p.value
-                return v.value if hasattr(v, "value") else v
+                if isinstance(param_set, dict):
+                    p = param_set.get(name)
+                else:
+                    p = param_set.itemByName(name)
             except Exception:
                 return None
+            return _raw_param_value(p)
 
         tool_obj = op.tool
         diameter_cm = _raw(tool_obj.parameters, "tool_diameter") if tool_obj else None
         flutes = _raw(tool_obj.parameters, "tool_numberOfFlutes") if tool_obj else None
-        rpm = _raw(op_params, "tool_spindleSpeed")
-        feed_mm_min = _raw(op_params, "tool_feedCutting")
+        rpm = _raw(param_index, "tool_spindleSpeed")
+        feed_mm_min = _raw(param_index, "tool_feedCutting")
 
         if diameter_cm and rpm:
-            diameter_mm = um.convert(diameter_cm, "cm", "mm")
+            diameter_mm = diameter_cm * _MM_PER_CM
             ss_m_min = math.pi * diameter_mm * rpm / 1000
             computed["surfaceSpeed"] = {
                 "value": round(ss_m_min, 2),
                 "unit": "m/min",
             }
-            ss_ft_min = um.convert(ss_m_min, "m/min", "ft/min")
+            ss_ft_min = ss_m_min * _FT_PER_M
             computed["surfaceSpeedImperial"] = {
                 "value": round(ss_ft_min, 2),
                 "unit": "ft/min",
@@ -107,14 +117,14 @@ def run(params):
                 "value": round(chip_load_mm, 4),
                 "unit": "mm/tooth",
             }
-            chip_load_in = um.convert(chip_load_mm, "mm", "in")
+            chip_load_in = chip_load_mm * _IN_PER_MM
             computed["chipLoadImperial"] = {
                 "value": round(chip_load_in, 5),
                 "unit": "in/tooth",
             }
 
         if diameter_cm:
-            stepover_cm = _raw(op_params, "stepover")
+            stepover_cm = _raw(param_index, "stepover")
             if stepover_cm and diameter_cm > 0:
                 computed["stepoverRatio"] = round(stepover_cm / diameter_cm, 3)
 
@@ -19,23 +19,25 @@ def run(params):
         if err:
             return err
         setups_to_scan = [setup]
-        operations = setup.allOperations
     else:
-        setups_to_scan = list(cam.setups)
-        operations = cam.allOperations
+        setups_to_scan = _setups_list(cam)
 
     # Build folder map across all relevant setups
     folder_map = {}
     for s in setups_to_scan:
         folder_map.update(_build_folder_map(s))
 
-    ops_data = []
-    for i in range(operations.count):
-        op = operations.item(i)
-        summary = _get_operation_summary(op)
-        folder = folder_map.get(op.name)
-        if folder:
-            summary["folder"] = folder
-        ops_data.append(summary)
+    # Walk setup by setup (the same order as cam.allOperations) so the
+    # setup's operation type is read once rather than via each op's
+    # parentSetup.
+    operations = []
+    for s in setups_to_scan:
+        op_type = _setup_op_type(s)
+        for op in _safe_iter(s.allOperations):
+            summary = _get_operation_summary(op, op_type=op_type)
+            folder = folder_map.get(summary["name"])
+            if folder:
+                summary["folder"] = folder
+            operations.append(summary)
 
-    return {"operations": ops_data}
+    return {"operations": operations}
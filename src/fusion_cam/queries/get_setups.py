@@ -14,7 +14,7 @@ def run(params):
         return err
 
     setups = []
-    for setup in cam.setups:
+    for setup in _setups_list(cam):
         setup_info = {
             "name": setup.name,
             "isSuppressed": setup.isSuppressed,
@@ -32,14 +32,9 @@ def run(params):
         # ── Machine info from setup.machine object ──
         machine_obj = _safe_attr(setup, "machine")
         if machine_obj:
-            machine_info = {
-                k: v for k, v in {
-                    "description": _safe_attr(machine_obj, "description"),
-                    "vendor": _safe_attr(machine_obj, "vendor"),
-                    "model": _safe_attr(machine_obj, "model"),
-                    "id": _safe_attr(machine_obj, "id"),
-                }.items() if v is not None
-            }
+            machine_info = _safe_attrs(
+                machine_obj, ("description", "vendor", "model", "id")
+            )
 
             url_obj = _safe_attr(machine_obj, "postURL")
             if url_obj:
@@ -58,17 +53,19 @@ def run(params):
                 setup_info["machine"] = machine_info
 
         # ── Read setup parameters using targeted lookups ──
+        # The extra machine_* scan walks every parameter anyway, so index
+        # them once and serve the named reads from the same pass.
         setup_params = _safe_attr(setup, "parameters")
         if setup_params:
+            param_index = _index_params(setup_params)
             machine_params = {}
             for mname in _MACHINE_PARAM_NAMES:
-                val = _read_param(setup_params, mname)
+                val = _read_param(param_index, mname)
                 if val is not None and not _is_proxy_str(val):
                     machine_params[mname] = val
 
             known_setup_params = set(_MACHINE_PARAM_NAMES) | set(_STOCK_PARAM_NAMES)
-            for p in _safe_iter(setup_params):
-                name = p.name
+            for name, p in param_index.items():
                 if name.startswith(("job_machine", "machine_")) and name not in known_setup_params:
                     val = _safe_param_value(p)
                     if val is not None and not _is_proxy_str(val):
@@ -81,13 +78,13 @@ def run(params):
 
             stock_info = {}
             for sname in _STOCK_PARAM_NAMES:
-                val = _read_param(setup_params, sname)
+                val = _read_param(param_index, sname)
                 if val is not None and not _is_proxy_str(val):
                     stock_info[sname] = val
             if stock_info:
                 setup_info["stock"] = stock_info
 
-            origin = _read_param(setup_params, "wcs_origin_boxPoint")
+            origin = _read_param(param_index, "wcs_origin_boxPoint")
             if origin is not None:
                 setup_info["wcsOrigin"] = str(origin)
 
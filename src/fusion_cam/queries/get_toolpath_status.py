@@ -6,6 +6,31 @@
 # Result: {summary: {...}, operations: [...]}
 # ──────────────────────────────────────────────────────────────────────
 
+def _op_status(op):
+    """Build the toolpath status entry for one operation."""
+    has_toolpath = op.hasToolpath
+    status = {
+        "name": op.name,
+        "isSuppressed": op.isSuppressed,
+        "hasToolpath": has_toolpath,
+    }
+
+    if has_toolpath:
+        valid = _safe_attr(op, "isToolpathValid")
+        if valid is not None:
+            status["isToolpathValid"] = valid
+
+    gen_state = _safe_attr(op, "generationStatus")
+    if gen_state is not None:
+        status["generationStatus"] = str(gen_state)
+
+    warning = _safe_attr(op, "warning")
+    if warning:
+        status["warning"] = warning
+
+    return status
+
+
 def run(params):
     document_name = params.get("document_name")
     cam, err = _get_cam(document_name)
@@ -22,34 +47,24 @@ def run(params):
     else:
         operations = cam.allOperations
 
-    statuses = []
-    for op in _safe_iter(operations):
-        status = {
-            "name": op.name,
-            "isSuppressed": op.isSuppressed,
-            "hasToolpath": op.hasToolpath,
-        }
-
-        if op.hasToolpath:
-            valid = _safe_attr(op, "isToolpathValid")
-            if valid is not None:
-                status["isToolpathValid"] = valid
-
-        gen_state = _safe_attr(op, "generationStatus")
-        if gen_state is not None:
-            status["generationStatus"] = str(gen_state)
-
-        warning = _safe_attr(op, "warning")
-        if warning:
-            status["warning"] = warning
+    statuses = [_op_status(op) for op in _safe_iter(operations)]
 
-        statuses.append(status)
+    # One pass over the statuses; _op_status always sets hasToolpath and
+    # isSuppressed, isToolpathValid only when known.
+    with_toolpath = valid = suppressed = 0
+    for s in statuses:
+        if s["hasToolpath"]:
+            with_toolpath += 1
+        if s.get("isToolpathValid"):
+            valid += 1
+        if s["isSuppressed"]:
+            suppressed += 1
 
     summary = {
         "total": len(statuses),
-        "withToolpath": sum(1 for s in statuses if s.get("hasToolpath")),
-        "valid": sum(1 for s in statuses if s.get("isToolpathValid")),
-        "suppressed": sum(1 for s in statuses if s.get("isSuppressed")),
+        "withToolpath": with_toolpath,
+        "valid": valid,
+        "suppressed": suppressed,
     }
 
     return {
@@ -13,15 +13,20 @@ def run(params):
     if err:
         return err
 
-    # Build operation→tool_number mapping for cross-reference
+    operations = _ops_list(cam.allOperations)
+
+    # Build operation→tool_number mapping for cross-reference; keep the
+    # (op, tool_number) pairs so the fallback below can reuse them.
     ops_by_tool_num = {}
-    for op in _safe_iter(cam.allOperations):
+    tooled_ops = []
+    for op in operations:
         if op.isSuppressed:
             continue
         tool = _safe_attr(op, "tool")
         if not tool:
             continue
         tn = _numval(_read_param(_safe_attr(tool, "parameters"), "tool_number"))
+        tooled_ops.append((op, tn))
         if tn is not None:
             ops_by_tool_num.setdefault(tn, []).append(op.name)
 
@@ -31,12 +36,7 @@ def run(params):
     lib = _safe_attr(cam, "documentToolLibrary")
     if lib:
         for tool in _safe_iter(lib):
-            tool_params = tool.parameters
-            info = {}
-            for key in TOOL_GEOM_PARAMS:
-                val = _read_param(tool_params, key)
-                if val is not None:
-                    info[key] = val
+            info = _read_params(tool.parameters, TOOL_GEOM_PARAMS)
 
             type_name = _safe_attr(tool, "type")
             if type_name is not None:
@@ -63,17 +63,17 @@ def run(params):
                 "usedInOperations": used_in,
             })
 
-    # Fallback: if DocumentToolLibrary was empty/unavailable, build from ops
+    # Fallback: if DocumentToolLibrary was empty/unavailable, build from ops.
+    # Operations sharing a tool number reuse the first tool's info, so the
+    # full tool read (geometry, holder, presets) happens once per tool.
     if not tools_list:
         tools_by_number = {}
-        for op in _safe_iter(cam.allOperations):
-            if op.isSuppressed:
-                continue
-            tool_info = _get_tool_info(op)
-            if not tool_info:
-                continue
-            tool_num = _numval(tool_info.get("tool_number")) or f"unknown_{op.name}"
+        for op, tn in tooled_ops:
+            tool_num = tn or f"unknown_{op.name}"
             if tool_num not in tools_by_number:
+                tool_info = _get_tool_info(op)
+                if not tool_info:
+                    continue
                 tools_by_number[tool_num] = {
                     "tool": tool_info,
                     "usedInOperations": [],
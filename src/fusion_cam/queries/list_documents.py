@@ -15,11 +15,11 @@ def run(params):
     active_name = active_doc.name if active_doc else None
 
     documents = []
-    for i in range(app.documents.count):
-        doc = app.documents.item(i)
+    for doc in _safe_iter(app.documents):
+        doc_name = doc.name
         doc_info = {
-            "name": doc.name,
-            "isActive": (doc.name == active_name),
+            "name": doc_name,
+            "isActive": (doc_name == active_name),
         }
 
         try:
@@ -28,8 +28,10 @@ def run(params):
             if cam_product:
                 cam = adsk.cam.CAM.cast(cam_product)
                 if cam:
-                    doc_info["setupCount"] = cam.setups.count if cam.setups else 0
-                    doc_info["operationCount"] = cam.allOperations.count if cam.allOperations else 0
+                    setups = cam.setups
+                    all_ops = cam.allOperations
+                    doc_info["setupCount"] = setups.count if setups else 0
+                    doc_info["operationCount"] = all_ops.count if all_ops else 0
         except Exception:
             doc_info["hasCAM"] = False
 
@@ -22,21 +22,23 @@ def run(params):
         return {"success": False, "error": "No material libraries available"}
 
     libraries = []
+    available = []
 
-    for i in range(mat_libs.count):
-        lib = mat_libs.item(i)
+    for lib in _safe_iter(mat_libs):
         lib_name = lib.name
+        available.append(lib_name)
 
         if library_name and lib_name != library_name:
             continue
 
+        lib_materials = lib.materials
         lib_info = {
             "name": lib_name,
-            "materialCount": lib.materials.count,
+            "materialCount": lib_materials.count,
         }
 
         materials = []
-        for mat in _safe_iter(lib.materials):
+        for mat in _safe_iter(lib_materials):
             mat_info = {"name": mat.name}
             mat_id = _safe_attr(mat, "id")
             if mat_id:
@@ -47,7 +49,6 @@ def run(params):
         libraries.append(lib_info)
 
     if library_name and not libraries:
-        available = [mat_libs.item(i).name for i in range(mat_libs.count)]
         return {
             "success": False,
             "error": f"Material library '{library_name}' not found. "
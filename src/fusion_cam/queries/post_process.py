@@ -54,8 +54,7 @@ def run(params):
 
     # Check that toolpaths are generated for all operations
     ops_to_check = operations if operation_names else [
-        setup.allOperations.item(i) for i in range(setup.allOperations.count)
-        if not setup.allOperations.item(i).isSuppressed
+        op for op in _ops_list(setup.allOperations) if not op.isSuppressed
     ]
     missing_toolpaths = [op.name for op in ops_to_check if not op.hasToolpath]
 